@@ -11,6 +11,14 @@ from audiobook_generator.config.general_config import GeneralConfig
 
 logger = logging.getLogger(__name__)
 
+# Patterns run once or more for every chapter, so compile them up front
+NEWLINES = re.compile(r"[\n]+")
+DOUBLE_NEWLINES = re.compile(r"[\n]{2,}")
+WHITESPACES = re.compile(r"\s+")
+ENDNOTE_NUMBERS = re.compile(r'(?<=[a-zA-Z.,!?;”")])\d+')
+NUMERIC_TITLE = re.compile(r'^\d{1,3}$')
+NON_WORD_CHARS = re.compile(r"[^\w\s]", flags=re.UNICODE)
+
 
 class EpubBookParser(BaseBookParser):
     def __init__(self, config: GeneralConfig):
@@ -46,25 +54,25 @@ class EpubBookParser(BaseBookParser):
             content = item.get_content()
             soup = BeautifulSoup(content, "lxml-xml")
             raw = soup.get_text(strip=False)
-            logger.debug(f"Raw text: <{raw[:]}>")
+            logger.debug("Raw text: <%s>", raw)
 
             # Replace excessive whitespaces and newline characters based on the mode
             if self.config.newline_mode == "single":
-                cleaned_text = re.sub(r"[\n]+", break_string, raw.strip())
+                cleaned_text = NEWLINES.sub(break_string, raw.strip())
             elif self.config.newline_mode == "double":
-                cleaned_text = re.sub(r"[\n]{2,}", break_string, raw.strip())
+                cleaned_text = DOUBLE_NEWLINES.sub(break_string, raw.strip())
             elif self.config.newline_mode == "none":
-                cleaned_text = re.sub(r"[\n]+", " ", raw.strip())
+                cleaned_text = NEWLINES.sub(" ", raw.strip())
             else:
                 raise ValueError(f"Invalid newline mode: {self.config.newline_mode}")
 
-            logger.debug(f"Cleaned text step 1: <{cleaned_text[:]}>")
-            cleaned_text = re.sub(r"\s+", " ", cleaned_text)
+            logger.debug("Cleaned text step 1: <%s>", cleaned_text)
+            cleaned_text = WHITESPACES.sub(" ", cleaned_text)
             logger.debug(f"Cleaned text step 2: <{cleaned_text[:100]}>")
 
             # Removes end-note numbers
             if self.config.remove_endnotes:
-                cleaned_text = re.sub(r'(?<=[a-zA-Z.,!?;”")])\d+', "", cleaned_text)
+                cleaned_text = ENDNOTE_NUMBERS.sub("", cleaned_text)
                 logger.debug(f"Cleaned text step 4: <{cleaned_text[:100]}>")
 
             # Get proper chapter title
@@ -75,7 +83,7 @@ class EpubBookParser(BaseBookParser):
                     if soup.find(level):
                         title = soup.find(level).text
                         break
-                if title == "" or re.match(r'^\d{1,3}$',title) is not None:
+                if title == "" or NUMERIC_TITLE.match(title) is not None:
                     title = cleaned_text[:60]
             elif self.config.title_mode == "tag_text":
                 title = ""
@@ -103,6 +111,6 @@ class EpubBookParser(BaseBookParser):
         # replace MAGIC_BREAK_STRING with a blank space
         # strip incase leading bank is missing
         title = title.replace(break_string, " ")
-        sanitized_title = re.sub(r"[^\w\s]", "", title, flags=re.UNICODE)
-        sanitized_title = re.sub(r"\s+", "_", sanitized_title.strip())
+        sanitized_title = NON_WORD_CHARS.sub("", title)
+        sanitized_title = WHITESPACES.sub("_", sanitized_title.strip())
         return sanitized_title
@@ -8,6 +8,8 @@ class GeneralConfig:
         self.log = args.log
         self.no_prompt = args.no_prompt
         self.title_mode = args.title_mode
+        self.worker_count = args.worker_count
+        self.use_cache = args.use_cache
 
         # Book parser specific arguments
         self.newline_mode = args.newline_mode
@@ -1,13 +1,30 @@
+import hashlib
 import logging
 import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 from audiobook_generator.book_parsers.base_book_parser import get_book_parser
 from audiobook_generator.config.general_config import GeneralConfig
 from audiobook_generator.core.audio_tags import AudioTags
+from audiobook_generator.core.utils import set_audio_tags
 from audiobook_generator.tts_providers.base_tts_provider import get_tts_provider
 
 logger = logging.getLogger(__name__)
 
+AUDIO_CACHE_FOLDER = ".cache"
+
+# Keeps "0001_<title>.<ext>" below the common 255-byte file name limit even for 3-byte UTF-8 titles
+MAX_FILE_TITLE_LENGTH = 80
+UNSAFE_FILE_NAME_CHARS = re.compile(r"[^\w\-. ]+")
+
+# Chapter text is written in slices of this many characters to keep the encoded buffer small
+TEXT_WRITE_CHUNK_SIZE = 1 << 16
+
+# Finds the first non-whitespace character without copying the text like str.strip() does
+has_visible_text = re.compile(r"\S").search
+
 
 def confirm_conversion():
     print("Do you want to continue? (y/n)")
@@ -17,11 +34,47 @@ def confirm_conversion():
         exit(0)
 
 
+def is_text_file_up_to_date(text_file, text):
+    # UTF-8 never uses fewer bytes than characters, so a smaller file can't hold this text
+    if not os.path.isfile(text_file) or os.path.getsize(text_file) < len(text):
+        return False
+    try:
+        with open(text_file, "r", encoding='utf-8') as file:
+            for start in range(0, len(text), TEXT_WRITE_CHUNK_SIZE):
+                if file.read(TEXT_WRITE_CHUNK_SIZE) != text[start:start + TEXT_WRITE_CHUNK_SIZE]:
+                    return False
+            return file.read(1) == ""
+    except UnicodeDecodeError:
+        return False
+
+
+def write_text_file(text_file, text):
+    if is_text_file_up_to_date(text_file, text):
+        logger.info(f"Skipping text file {text_file}, it is already up to date")
+        return
+    with open(text_file, "w", encoding='utf-8', buffering=TEXT_WRITE_CHUNK_SIZE) as file:
+        for start in range(0, len(text), TEXT_WRITE_CHUNK_SIZE):
+            file.write(text[start:start + TEXT_WRITE_CHUNK_SIZE])
+
+
+def get_audio_cache_key(config, text):
+    # Every setting that changes the synthesized audio must be part of the key
+    settings = [config.tts, config.language, config.voice_name, config.output_format, config.model_name,
+                config.break_duration, config.voice_rate, config.voice_volume, config.voice_pitch]
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("|".join(str(setting) for setting in settings).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_chapter_file_name(idx, title, ext):
+    safe_title = UNSAFE_FILE_NAME_CHARS.sub("_", title)[:MAX_FILE_TITLE_LENGTH]
+    return f"{idx:04d}_{safe_title}.{ext}"
+
+
 def get_total_chars(chapters):
-    total_characters = 0
-    for title, text in chapters:
-        total_characters += len(text)
-    return total_characters
+    return sum(len(text) for _, text in chapters)
 
 
 class AudiobookGenerator:
@@ -34,13 +87,21 @@ class AudiobookGenerator:
 
     def run(self):
         try:
+            # Check this before parsing, which takes a while for big books
+            if self.config.worker_count < 1:
+                raise ValueError(
+                    f"Worker count {self.config.worker_count} must be at least 1. Check your input."
+                )
+
             book_parser = get_book_parser(self.config)
             tts_provider = get_tts_provider(self.config)
 
             os.makedirs(self.config.output_folder, exist_ok=True)
+            if self.config.use_cache:
+                os.makedirs(os.path.join(self.config.output_folder, AUDIO_CACHE_FOLDER), exist_ok=True)
             chapters = book_parser.get_chapters(tts_provider.get_break_string())
             # Filter out empty or very short chapters
-            chapters = [(title, text) for title, text in chapters if text.strip()]
+            chapters = [(title, text) for title, text in chapters if has_visible_text(text)]
 
             # Check chapter start and end args
             if self.config.chapter_start < 1 or self.config.chapter_start > len(chapters):
@@ -76,37 +137,87 @@ class AudiobookGenerator:
                 confirm_conversion()
 
             # Loop through each chapter and convert it to speech using the provided TTS provider
+            selected_chapters = []
             for idx, (title, text) in enumerate(chapters, start=1):
                 if idx < self.config.chapter_start:
                     continue
                 if idx > self.config.chapter_end:
                     break
-                logger.info(
-                    f"Converting chapter {idx}/{len(chapters)}: {title}, characters: {len(text)}"
-                )
-
-                if self.config.output_text:
-                    text_file = os.path.join(self.config.output_folder, f"{idx:04d}_{title}.txt")
-                    with open(text_file, "w", encoding='utf-8') as file:
-                        file.write(text)
-
-                if self.config.preview:
-                    continue
-
-                output_file = os.path.join(self.config.output_folder,
-                                           f"{idx:04d}_{title}.{tts_provider.get_output_file_extension()}")
-
-                audio_tags = AudioTags(title, book_parser.get_book_author(), book_parser.get_book_title(), idx)
-                tts_provider.text_to_speech(
-                    text,
-                    output_file,
-                    audio_tags,
-                )
-                logger.info(
-                    f"✅ Converted chapter {idx}/{len(chapters)}: {title}"
-                )
+                selected_chapters.append((idx, title, text))
+
+            book_author = book_parser.get_book_author()
+            book_title = book_parser.get_book_title()
+            # Preview never writes audio, so formats without a known extension must not fail it
+            output_ext = None if self.config.preview else tts_provider.get_output_file_extension()
+
+            def convert(idx, title, text):
+                self.process_chapter(idx, title, text, len(chapters), tts_provider, book_author, book_title,
+                                     output_ext)
+
+            if self.config.worker_count > 1 and not self.config.preview:
+                logger.info(f"Converting chapters with {self.config.worker_count} workers.")
+                executor = ThreadPoolExecutor(max_workers=self.config.worker_count)
+                try:
+                    futures = [executor.submit(convert, idx, title, text) for idx, title, text in selected_chapters]
+                    # Collect in submission order so the first failing chapter is the one reported
+                    for future in futures:
+                        future.result()
+                except KeyboardInterrupt:
+                    # Running chapters can't be interrupted, and exit() would join their worker threads while
+                    # they keep calling the TTS provider, so drop the queue and leave the process right away
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    logger.info("Job stopped by user.")
+                    logging.shutdown()
+                    os._exit(0)
+                except BaseException:
+                    # Chapters that already started are finished before the error is raised
+                    executor.shutdown(cancel_futures=True)
+                    raise
+                executor.shutdown()
+            else:
+                for idx, title, text in selected_chapters:
+                    convert(idx, title, text)
             logger.info(f"All chapters converted. 🎉🎉🎉")
 
         except KeyboardInterrupt:
             logger.info("Job stopped by user.")
             exit()
+
+    def process_chapter(self, idx, title, text, total_chapters, tts_provider, book_author, book_title, output_ext):
+        logger.info(
+            f"Converting chapter {idx}/{total_chapters}: {title}, characters: {len(text)}"
+        )
+
+        if self.config.output_text:
+            text_file = os.path.join(self.config.output_folder, get_chapter_file_name(idx, title, "txt"))
+            write_text_file(text_file, text)
+
+        if self.config.preview:
+            return
+
+        output_file = os.path.join(self.config.output_folder, get_chapter_file_name(idx, title, output_ext))
+
+        audio_tags = AudioTags(title, book_author, book_title, idx)
+        cached_file = None
+        if self.config.use_cache:
+            cached_file = os.path.join(self.config.output_folder, AUDIO_CACHE_FOLDER,
+                                       f"{get_audio_cache_key(self.config, text)}.{output_ext}")
+
+        if cached_file and os.path.isfile(cached_file):
+            logger.info(f"Reusing cached audio for chapter {idx}/{total_chapters}: {cached_file}")
+            shutil.copyfile(cached_file, output_file)
+            set_audio_tags(output_file, audio_tags)
+        else:
+            tts_provider.text_to_speech(
+                text,
+                output_file,
+                audio_tags,
+            )
+            if cached_file:
+                # Copy under a temporary name first so other workers never see a partial cache entry
+                partial_file = f"{cached_file}.{os.getpid()}.{idx}.part"
+                shutil.copyfile(output_file, partial_file)
+                os.replace(partial_file, cached_file)
+        logger.info(
+            f"✅ Converted chapter {idx}/{total_chapters}: {title}"
+        )
@@ -7,32 +7,37 @@ logger = logging.getLogger(__name__)
 
 
 def split_text(text: str, max_chars: int, language: str) -> List[str]:
+    # Chunks are collected as lists and joined once, repeated str += would copy the chunk on every step
     chunks = []
-    current_chunk = ""
 
     if language.startswith("zh"):  # Chinese
+        current_chars = []
         for char in text:
-            if len(current_chunk) + 1 <= max_chars or is_special_char(char):
-                current_chunk += char
+            if len(current_chars) + 1 <= max_chars or is_special_char(char):
+                current_chars.append(char)
             else:
-                chunks.append(current_chunk)
-                current_chunk = char
+                chunks.append("".join(current_chars))
+                current_chars = [char]
 
-        if current_chunk:
-            chunks.append(current_chunk)
+        if current_chars:
+            chunks.append("".join(current_chars))
 
     else:
         words = text.split()
+        current_words = []
+        current_length = 0
 
         for word in words:
-            if len(current_chunk) + len(word) + 1 <= max_chars:
-                current_chunk += (" " if current_chunk else "") + word
+            if current_length + len(word) + 1 <= max_chars:
+                current_length += len(word) + (1 if current_words else 0)
+                current_words.append(word)
             else:
-                chunks.append(current_chunk)
-                current_chunk = word
+                chunks.append(" ".join(current_words))
+                current_words = [word]
+                current_length = len(word)
 
-        if current_chunk:
-            chunks.append(current_chunk)
+        if current_words:
+            chunks.append(" ".join(current_words))
 
     logger.info(f"Split text into {len(chunks)} chunks")
     for i, chunk in enumerate(chunks, 1):
@@ -49,7 +54,7 @@ def set_audio_tags(output_file, audio_tags):
     try:
         try:
             tags = ID3(output_file)
-            print(tags)
+            logger.debug("Existing tags: %s", tags)
         except ID3NoHeaderError:
             logger.debug(f"handling ID3NoHeaderError: {output_file}")
             tags = ID3()
@@ -71,5 +76,5 @@ def is_special_char(char: str) -> bool:
         or (char in "。，、？！：；“”‘’（）《》【】…—～·「」『』〈〉〖〗〔〕")
         or (char in "∶")
     )  # special unicode punctuation
-    logger.debug(f"is_special_char> char={char}, ord={ord_char}, result={result}")
+    logger.debug("is_special_char> char=%s, ord=%s, result=%s", char, ord_char, result)
     return result
\ No newline at end of file
@@ -98,10 +98,10 @@ class AzureTTSProvider(BaseTTSProvider):
 
         for i, chunk in enumerate(text_chunks, 1):
             logger.debug(
-                f"Processing chunk {i} of {len(text_chunks)}, length={len(chunk)}, text=[{chunk}]"
+                "Processing chunk %s of %s, length=%s, text=[%s]", i, len(text_chunks), len(chunk), chunk
             )
             escaped_text = html.escape(chunk)
-            logger.debug(f"Escaped text: [{escaped_text}]")
+            logger.debug("Escaped text: [%s]", escaped_text)
             # replace MAGIC_BREAK_STRING with a break tag for section/paragraph break
             escaped_text = escaped_text.replace(
                 self.get_break_string().strip(),
@@ -111,7 +111,7 @@ class AzureTTSProvider(BaseTTSProvider):
                 f"Processing chapter-{audio_tags.idx} <{audio_tags.title}>, chunk {i} of {len(text_chunks)}"
             )
             ssml = f"<speak version='1.0' xmlns='http://www.w3.org/2001/10/synthesis' xml:lang='{self.config.language}'><voice name='{self.config.voice_name}'>{escaped_text}</voice></speak>"
-            logger.debug(f"SSML: [{ssml}]")
+            logger.debug("SSML: [%s]", ssml)
 
             for retry in range(MAX_RETRIES):
                 self.auto_renew_access_token()
@@ -57,20 +57,20 @@ class CommWithPauses:
 
     def parse_text(self):
         logger.debug(
-            f"Parsing the text, looking for break/pauses in text: <{self.full_text}>"
+            "Parsing the text, looking for break/pauses in text: <%s>", self.full_text
         )
         if self.break_string not in self.full_text:
             logger.debug(f"No break/pauses found in the text")
             return [self.full_text]
 
         parts = self.full_text.split(self.break_string)
-        logger.debug(f"split into <{len(parts)}> parts: {parts}")
+        logger.debug("split into <%s> parts: %s", len(parts), parts)
         return parts
 
     async def chunkify(self):
         logger.debug(f"Chunkifying the text")
         for content in self.parsed:
-            logger.debug(f"content from parsed: <{content}>")
+            logger.debug("content from parsed: <%s>", content)
             audio_bytes = await self.generate_audio(content)
             self.file.write(audio_bytes)
             if content != self.parsed[-1] and self.break_duration > 0:
@@ -86,7 +86,7 @@ class CommWithPauses:
         return silent.raw_data  # type: ignore
 
     async def generate_audio(self, text: str) -> bytes:
-        logger.debug(f"Generating audio for: <{text}>")
+        logger.debug("Generating audio for: <%s>", text)
         # this genertes the real TTS using edge_tts for this part.
         temp_chunk = io.BytesIO()
         communicate = edge_tts.Communicate(text, self.voice_name)
@@ -50,13 +50,13 @@ class OpenAITTSProvider(BaseTTSProvider):
 
         for i, chunk in enumerate(text_chunks, 1):
             logger.debug(
-                f"Processing chunk {i} of {len(text_chunks)}, length={len(chunk)}, text=[{chunk}]"
+                "Processing chunk %s of %s, length=%s, text=[%s]", i, len(text_chunks), len(chunk), chunk
             )
             logger.info(
                 f"Processing chapter-{audio_tags.idx} <{audio_tags.title}>, chunk {i} of {len(text_chunks)}"
             )
 
-            logger.debug(f"Text: [{chunk}], length={len(chunk)}")
+            logger.debug("Text: [%s], length=%s", chunk, len(chunk))
 
             # NO retry for OpenAI TTS because SDK has built-in retry logic
             response = self.client.audio.speech.create(
@@ -80,6 +80,17 @@ def handle_args():
         action="store_true",
         help="This will remove endnote numbers from the end or middle of sentences. This is useful for academic books.",
     )
+    parser.add_argument(
+        "--worker_count",
+        default=1,
+        type=int,
+        help="Number of chapters converted in parallel (default: 1). TTS requests are network-bound, so a few workers speed up conversion a lot, but keep it within your TTS provider's rate limits.",
+    )
+    parser.add_argument(
+        "--use_cache",
+        action="store_true",
+        help="Cache generated audio in a .cache folder inside the output folder. Chapters whose text and voice settings haven't changed are copied from the cache on later runs instead of being sent to the TTS provider again.",
+    )
 
     parser.add_argument(
         "--voice_name",
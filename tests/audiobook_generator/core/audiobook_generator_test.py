@@ -0,0 +1,224 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from mutagen.id3 import ID3
+
+from audiobook_generator.config.general_config import GeneralConfig
+from audiobook_generator.core.audiobook_generator import AudiobookGenerator, get_audio_cache_key, \
+    get_chapter_file_name, get_total_chars, is_text_file_up_to_date, write_text_file
+from tests.test_utils import get_azure_config
+
+CHAPTERS = [(f"Chapter_{i}", f"Text of chapter {i}.") for i in range(1, 7)]
+
+
+def get_generator_config(output_folder, **kwargs):
+    args = MagicMock(
+        input_file='book.epub',
+        output_folder=output_folder,
+        preview=False,
+        output_text=False,
+        log='INFO',
+        no_prompt=True,
+        title_mode='auto',
+        worker_count=1,
+        use_cache=False,
+        newline_mode='double',
+        chapter_start=1,
+        chapter_end=-1,
+        remove_endnotes=False,
+        tts='azure',
+        language='en-US',
+        voice_name='en-US-GuyNeural',
+        output_format='audio-24khz-48kbitrate-mono-mp3',
+        model_name='',
+        break_duration='1250',
+        voice_rate=None,
+        voice_volume=None,
+        voice_pitch=None,
+        proxy=None,
+    )
+    for key, value in kwargs.items():
+        setattr(args, key, value)
+    return GeneralConfig(args)
+
+
+class FakeBookParser:
+    def __init__(self, chapters):
+        self.chapters = chapters
+
+    def get_chapters(self, break_string):
+        return self.chapters
+
+    def get_book_title(self):
+        return "Fake Book"
+
+    def get_book_author(self):
+        return "Fake Author"
+
+
+class FakeTTSProvider:
+    def __init__(self, fail_on=None, output_file_extension="mp3"):
+        self.fail_on = fail_on
+        self.output_file_extension = output_file_extension
+        self.converted = []
+        self.lock = threading.Lock()
+
+    def get_break_string(self):
+        return "   "
+
+    def estimate_cost(self, total_chars):
+        return 0
+
+    def get_output_file_extension(self):
+        if self.output_file_extension is None:
+            raise NotImplementedError("Unknown file extension")
+        return self.output_file_extension
+
+    def text_to_speech(self, text, output_file, audio_tags):
+        if audio_tags.idx == self.fail_on:
+            raise RuntimeError(f"TTS failed for chapter {audio_tags.idx}")
+        with open(output_file, "wb") as file:
+            file.write(text.encode("utf-8"))
+        with self.lock:
+            self.converted.append((audio_tags.idx, os.path.basename(output_file)))
+
+
+def run_generator(config, tts_provider, chapters=CHAPTERS):
+    with patch('audiobook_generator.core.audiobook_generator.get_book_parser',
+               return_value=FakeBookParser(chapters)), \
+            patch('audiobook_generator.core.audiobook_generator.get_tts_provider', return_value=tts_provider):
+        AudiobookGenerator(config).run()
+
+
+class TestAudiobookGenerator(unittest.TestCase):
+
+    def test_get_total_chars(self):
+        chapters = [("Chapter_1", "Hello"), ("Chapter_2", "World!")]
+        self.assertEqual(get_total_chars(chapters), 11)
+        self.assertEqual(get_total_chars([]), 0)
+
+    def test_get_chapter_file_name(self):
+        self.assertEqual(get_chapter_file_name(1, "CHAPTER_I_START_IN_LIFE", "mp3"), "0001_CHAPTER_I_START_IN_LIFE.mp3")
+        self.assertEqual(get_chapter_file_name(12, "第一章", "txt"), "0012_第一章.txt")
+        self.assertEqual(get_chapter_file_name(3, "../a/b\0c", "mp3"), "0003_.._a_b_c.mp3")
+        self.assertEqual(get_chapter_file_name(4, "x" * 200, "mp3"), f"0004_{'x' * 80}.mp3")
+
+    def test_write_text_file(self):
+        with tempfile.TemporaryDirectory() as output_folder:
+            text_file = os.path.join(output_folder, "0001_Chapter_1.txt")
+            text = "Call me Ishmael. 你好，世界。 " * 10000
+
+            self.assertFalse(is_text_file_up_to_date(text_file, text))
+            write_text_file(text_file, text)
+            with open(text_file, "r", encoding='utf-8') as file:
+                self.assertEqual(file.read(), text)
+
+            self.assertTrue(is_text_file_up_to_date(text_file, text))
+            self.assertFalse(is_text_file_up_to_date(text_file, text[:-1]))
+            self.assertFalse(is_text_file_up_to_date(text_file, text + "!"))
+            self.assertFalse(is_text_file_up_to_date(text_file, text[:-1] + "?"))
+
+    def test_get_audio_cache_key(self):
+        config = get_azure_config()
+        config.voice_rate = "+0%"
+        config.voice_volume = "+0%"
+        config.voice_pitch = "+0Hz"
+        key = get_audio_cache_key(config, "Hello World!")
+        self.assertEqual(len(key), 32)
+        self.assertEqual(get_audio_cache_key(config, "Hello World!"), key)
+        self.assertNotEqual(get_audio_cache_key(config, "Hello World?"), key)
+
+        config.voice_name = "en-US-JennyNeural"
+        self.assertNotEqual(get_audio_cache_key(config, "Hello World!"), key)
+
+    def test_run_sequential(self):
+        with tempfile.TemporaryDirectory() as output_folder:
+            tts_provider = FakeTTSProvider()
+            run_generator(get_generator_config(output_folder), tts_provider)
+            self.assertEqual(tts_provider.converted,
+                             [(idx, f"{idx:04d}_Chapter_{idx}.mp3") for idx in range(1, 7)])
+
+    def test_run_with_workers(self):
+        with tempfile.TemporaryDirectory() as output_folder:
+            tts_provider = FakeTTSProvider()
+            run_generator(get_generator_config(output_folder, worker_count=3), tts_provider)
+            self.assertEqual(sorted(tts_provider.converted),
+                             [(idx, f"{idx:04d}_Chapter_{idx}.mp3") for idx in range(1, 7)])
+            for idx, file_name in tts_provider.converted:
+                with open(os.path.join(output_folder, file_name), "rb") as file:
+                    self.assertEqual(file.read().decode("utf-8"), f"Text of chapter {idx}.")
+
+    def test_run_with_workers_raises_chapter_error(self):
+        with tempfile.TemporaryDirectory() as output_folder:
+            tts_provider = FakeTTSProvider(fail_on=2)
+            with self.assertRaisesRegex(RuntimeError, "TTS failed for chapter 2"):
+                run_generator(get_generator_config(output_folder, worker_count=3), tts_provider)
+
+    def test_run_with_workers_exits_on_keyboard_interrupt(self):
+        with tempfile.TemporaryDirectory() as output_folder:
+            tts_provider = FakeTTSProvider()
+            tts_provider.text_to_speech = MagicMock(side_effect=KeyboardInterrupt)
+            with patch('os._exit') as os_exit:
+                run_generator(get_generator_config(output_folder, worker_count=2), tts_provider)
+            os_exit.assert_called_once_with(0)
+
+    def test_run_preview_ignores_unknown_output_format(self):
+        with tempfile.TemporaryDirectory() as output_folder:
+            tts_provider = FakeTTSProvider(output_file_extension=None)
+            run_generator(get_generator_config(output_folder, preview=True, output_text=True), tts_provider)
+            self.assertEqual(sorted(os.listdir(output_folder)),
+                             [f"{idx:04d}_Chapter_{idx}.txt" for idx in range(1, 7)])
+            self.assertEqual(tts_provider.converted, [])
+
+    def test_run_without_cache(self):
+        with tempfile.TemporaryDirectory() as output_folder:
+            run_generator(get_generator_config(output_folder), FakeTTSProvider())
+            self.assertFalse(os.path.exists(os.path.join(output_folder, ".cache")))
+
+    def test_run_cache_miss_stores_audio(self):
+        with tempfile.TemporaryDirectory() as output_folder:
+            config = get_generator_config(output_folder, use_cache=True, worker_count=3)
+            tts_provider = FakeTTSProvider()
+            run_generator(config, tts_provider)
+            self.assertEqual(len(tts_provider.converted), len(CHAPTERS))
+
+            cache_folder = os.path.join(output_folder, ".cache")
+            self.assertEqual(sorted(os.listdir(cache_folder)),
+                             sorted(f"{get_audio_cache_key(config, text)}.mp3" for _, text in CHAPTERS))
+            for _, text in CHAPTERS:
+                with open(os.path.join(cache_folder, f"{get_audio_cache_key(config, text)}.mp3"), "rb") as file:
+                    self.assertEqual(file.read(), text.encode("utf-8"))
+
+    def test_run_cache_hit_skips_tts_and_retags(self):
+        with tempfile.TemporaryDirectory() as output_folder:
+            run_generator(get_generator_config(output_folder, use_cache=True), FakeTTSProvider())
+
+            # Same texts under new titles: audio comes from the cache but tags follow the current chapters
+            renamed_chapters = [(f"Renamed_{i}", text) for i, (_, text) in enumerate(CHAPTERS, start=1)]
+            tts_provider = FakeTTSProvider()
+            tts_provider.text_to_speech = MagicMock()
+            run_generator(get_generator_config(output_folder, use_cache=True), tts_provider, renamed_chapters)
+            tts_provider.text_to_speech.assert_not_called()
+
+            for idx, (title, text) in enumerate(renamed_chapters, start=1):
+                output_file = os.path.join(output_folder, f"{idx:04d}_{title}.mp3")
+                tags = ID3(output_file)
+                self.assertEqual(str(tags["TIT2"]), title)
+                self.assertEqual(str(tags["TRCK"]), str(idx))
+                self.assertEqual(str(tags["TALB"]), "Fake Book")
+
+    def test_run_rejects_invalid_worker_count(self):
+        with tempfile.TemporaryDirectory() as output_folder:
+            book_parser = MagicMock()
+            with patch('audiobook_generator.core.audiobook_generator.get_book_parser',
+                       return_value=book_parser):
+                with self.assertRaises(ValueError):
+                    AudiobookGenerator(get_generator_config(output_folder, worker_count=0)).run()
+            book_parser.get_chapters.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
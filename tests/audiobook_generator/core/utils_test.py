@@ -0,0 +1,23 @@
+import unittest
+
+from audiobook_generator.core.utils import split_text
+
+
+class TestUtils(unittest.TestCase):
+
+    def test_split_text_by_words(self):
+        text = "The quick brown fox jumps over the lazy dog"
+        chunks = split_text(text, 15, "en-US")
+        self.assertEqual(chunks, ["The quick brown", "fox jumps over", "the lazy dog"])
+        self.assertTrue(all(len(chunk) <= 15 for chunk in chunks))
+        self.assertEqual(" ".join(chunks), text)
+
+    def test_split_text_chinese(self):
+        text = "你好世界，这是一个测试。"
+        chunks = split_text(text, 4, "zh-CN")
+        self.assertEqual(chunks, ["你好世界，", "这是一个", "测试。"])
+        self.assertEqual("".join(chunks), text)
+
+
+if __name__ == '__main__':
+    unittest.main()